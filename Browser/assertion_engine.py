@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import time
+from functools import cache
 from typing import Optional, Union, get_args, get_origin
 
 import wrapt  # type: ignore
@@ -20,17 +21,21 @@ from assertionengine import AssertionOperator
 from .utils import logger
 
 
-def assertion_operator_is_set(wrapped, args, kwargs):
-    assertion_operator = None
-    assertion_op_name = None
-    assertion_op_index = None
-    for index, (_arg, typ) in enumerate(wrapped.__annotations__.items()):
+@cache
+def _assertion_operator_position(function) -> tuple[Optional[int], Optional[str]]:
+    for index, (arg, typ) in enumerate(function.__annotations__.items()):
         if get_origin(typ) is Union and AssertionOperator in get_args(typ):
-            assertion_op_index = index
-            break
+            return index, arg
         if typ is AssertionOperator:
-            assertion_op_index = index
-            break
+            return index, arg
+    return None, None
+
+
+def assertion_operator_is_set(wrapped, args, kwargs):
+    assertion_operator = None
+    assertion_op_index, assertion_op_name = _assertion_operator_position(
+        getattr(wrapped, "__func__", wrapped)
+    )
     if assertion_op_index is not None:
         if len(args) > assertion_op_index:
             assertion_operator = args[assertion_op_index]
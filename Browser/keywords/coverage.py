@@ -12,16 +12,63 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from os import PathLike
+from functools import cached_property, lru_cache
+from os import PathLike, fspath
 from pathlib import Path
 from typing import Optional
 
 from ..base import LibraryComponent
-from ..generated.playwright_pb2 import Request
+from ..generated.playwright_pb2 import Request, Response
 from ..utils import CoverageType, keyword, logger
 
+_COVERAGE_TYPE_NAME = {
+    coverage_type: coverage_type.name for coverage_type in CoverageType
+}
+_COVERAGE_TYPE_STR = {
+    coverage_type: str(coverage_type) for coverage_type in CoverageType
+}
+
+
+@lru_cache(maxsize=128)
+def _coverage_start_request(
+    *,
+    coverage_type: str,
+    reset_on_navigation: bool,
+    report_anonymous_scripts: bool,
+    config_file: str,
+    coverage_dir: str,
+    raw: bool,
+) -> bytes:
+    request = Request.CoverageStart()
+    request.coverageType = coverage_type
+    request.resetOnNavigation = reset_on_navigation
+    request.reportAnonymousScripts = report_anonymous_scripts
+    request.configFile = config_file
+    request.coverageDir = coverage_dir
+    request.raw = raw
+    return request.SerializeToString()
+
 
 class Coverage(LibraryComponent):
+    @cached_property
+    def _start_coverage_call(self):
+        return self.playwright.serialized_request_call(
+            "StartCoverage", Response.Empty.FromString
+        )
+
+    @staticmethod
+    def _find_coverage_report(coverage_dir: Path) -> Optional[Path]:
+        try:
+            return next(
+                (
+                    file
+                    for file in coverage_dir.iterdir()
+                    if file.name.endswith(".html") and file.is_file()
+                ),
+                None,
+            )
+        except OSError:
+            return None
 
     @keyword(tags=("Setter", "Coverage", "Experimental"))
     def start_coverage(
@@ -68,20 +115,22 @@ class Coverage(LibraryComponent):
         | Do Something In The Page
         | `Stop Coverage`
         """
-        logger.info(f"Starting coverage for {coverage_type.name}")
-        with self.playwright.grpc_channel() as stub:
-            response = stub.StartCoverage(
-                Request.CoverageStart(
-                    coverageType=coverage_type.name,
-                    resetOnNavigation=resetOnNavigation,
-                    reportAnonymousScripts=reportAnonymousScripts,
-                    configFile=str(config_file) if config_file else "",
-                    coverageDir=str(self.coverage_ouput / path),
-                    raw=raw,
-                )
+        coverage_type_name = _COVERAGE_TYPE_NAME[coverage_type]
+        logger.info(f"Starting coverage for {coverage_type_name}")
+        # The stub is not needed, the context is used for the Playwright process
+        # check and for converting errors to AssertionError.
+        with self.playwright.grpc_channel():
+            request = _coverage_start_request(
+                coverage_type=coverage_type_name,
+                reset_on_navigation=resetOnNavigation,
+                report_anonymous_scripts=reportAnonymousScripts,
+                config_file=fspath(config_file) if config_file else "",
+                coverage_dir=str(self.coverage_ouput / path),
+                raw=raw,
             )
+            response = self._start_coverage_call(request)
             logger.info(response.log)
-        return str(coverage_type)
+        return _COVERAGE_TYPE_STR[coverage_type]
 
     @keyword(tags=("Getter", "Coverage"))
     def stop_coverage(
@@ -101,13 +150,12 @@ class Coverage(LibraryComponent):
             response = stub.StopCoverage(Request.Empty())
             logger.info(response.log)
         coverage_dir = Path(response.body)
-        coverage_index_html = list(coverage_dir.glob("*.html"))
-        if not coverage_index_html:
+        file_path = self._find_coverage_report(coverage_dir)
+        if file_path is None:
             logger.info(
                 f"No coverage report found from  {coverage_dir}. Default folder or file type "
                 "could have been changed by {config_file}, return the coverage folder."
             )
             return coverage_dir
-        file_path = coverage_index_html[0]
         logger.info(f"Coverage report saved to {file_path.as_uri()}")
         return file_path
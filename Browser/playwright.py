@@ -20,11 +20,11 @@ import time
 from functools import cached_property
 from pathlib import Path
 from subprocess import DEVNULL, STDOUT, CalledProcessError, Popen, run
-from typing import TYPE_CHECKING, Optional, Union
+from typing import TYPE_CHECKING, Callable, Optional, Union
 
 import grpc  # type: ignore
 
-from Browser.generated import playwright_pb2_grpc
+from Browser.generated import playwright_pb2, playwright_pb2_grpc
 from Browser.generated.playwright_pb2 import Request
 
 from .base import LibraryComponent
@@ -153,11 +153,31 @@ class Playwright(LibraryComponent):
     def _channel(self):
         return grpc.insecure_channel(f"127.0.0.1:{self.port}")
 
+    @cached_property
+    def _stub(self):
+        return playwright_pb2_grpc.PlaywrightStub(self._channel)
+
+    def serialized_request_call(self, method: str, response_deserializer: Callable):
+        """Returns callable for ``method`` which takes already serialized request bytes.
+
+        Invoke the returned callable inside `grpc_channel` context to get the same
+        error handling as with the stub.
+        """
+        descriptor = playwright_pb2.DESCRIPTOR.services_by_name[
+            "Playwright"
+        ].methods_by_name[method]
+        return self._channel.unary_unary(
+            f"/{descriptor.containing_service.full_name}/{descriptor.name}",
+            request_serializer=None,
+            response_deserializer=response_deserializer,
+        )
+
     @contextlib.contextmanager
     def grpc_channel(self, original_error=False):
-        """Yields a PlayWrightstub on a newly initialized channel
+        """Yields a PlayWrightstub on the shared channel
 
-        Acts as a context manager, so channel is closed automatically when control returns.
+        The stub is created once and reused for all calls. Acts as a context manager,
+        so errors from the call are converted to assertion errors.
         """
         playwright_process = self._playwright_process
         if playwright_process:
@@ -167,7 +187,7 @@ class Playwright(LibraryComponent):
                     f"Playwright process has been terminated with code {returncode}"
                 )
         try:
-            yield playwright_pb2_grpc.PlaywrightStub(self._channel)
+            yield self._stub
         except grpc.RpcError as error:
             if original_error:
                 raise error
@@ -14,6 +14,7 @@
 import re
 from datetime import timedelta
 from enum import Enum, IntFlag, auto
+from functools import cache
 from typing import Dict, Optional, TypedDict, Union  # noqa: UP035
 
 from robot.running.arguments.typeconverters import TypeConverter
@@ -38,6 +39,18 @@ class TypedDictDummy(TypedDict):
     pass
 
 
+@cache
+def _typed_dict_meta(data_type) -> tuple[tuple, tuple, dict]:
+    required = tuple((key, key.lower()) for key in data_type.__required_keys__)
+    optional = tuple((key, key.lower()) for key in data_type.__optional_keys__)
+    return required, optional, data_type.__annotations__
+
+
+def _as_type(value, value_type):
+    """Converts ``value`` with ``value_type`` unless it already is exactly of that type."""
+    return value if type(value) is value_type else value_type(value)
+
+
 def convert_typed_dict(function_annotations: dict, params: dict) -> dict:  # noqa: C901
     for arg_name, arg_type in function_annotations.items():
         if arg_name not in params or params[arg_name] is None:
@@ -56,21 +69,23 @@ def convert_typed_dict(function_annotations: dict, params: dict) -> dict:  # noq
                 raise TypeError(
                     f"Argument '{arg_name}' expects a dictionary like object but did get '{type(arg_value)} instead.'"
                 )
-            lower_case_dict = {k.lower(): v for k, v in arg_value.items()}
-            struct = arg_type.__annotations__
+            required, optional, struct = _typed_dict_meta(arg_type)
+            orig_by_lower = {k.lower(): k for k in arg_value}
             typed_dict = arg_type()
-            for req_key in arg_type.__required_keys__:
-                if req_key.lower() not in lower_case_dict:
+            for req_key, lower_key in required:
+                orig_key = orig_by_lower.get(lower_key)
+                if orig_key is None:
                     raise RuntimeError(
-                        f"`{lower_case_dict}` cannot be converted to {arg_type.__name__} for argument '{arg_name}'."
+                        f"`{arg_value}` cannot be converted to {arg_type.__name__} for argument '{arg_name}'."
                         f"\nThe required key '{req_key}' in not set in given value."
-                        f"\nExpected types: {arg_type.__annotations__}"
+                        f"\nExpected types: {struct}"
                     )
-                typed_dict[req_key] = struct[req_key](lower_case_dict[req_key.lower()])  # type: ignore
-            for opt_key in arg_type.__optional_keys__:
-                if opt_key.lower() not in lower_case_dict:
+                typed_dict[req_key] = _as_type(arg_value[orig_key], struct[req_key])  # type: ignore
+            for opt_key, lower_key in optional:
+                orig_key = orig_by_lower.get(lower_key)
+                if orig_key is None:
                     continue
-                typed_dict[opt_key] = struct[opt_key](lower_case_dict[opt_key.lower()])  # type: ignore
+                typed_dict[opt_key] = _as_type(arg_value[orig_key], struct[opt_key])  # type: ignore
             params[arg_name] = typed_dict
     return params
 
@@ -737,16 +752,18 @@ class SelectionType(Enum):
         if isinstance(value, cls):
             return value
         if isinstance(value, str):
-            try:
-                return cls[value.upper()]
-            except KeyError:
-                return value
+            return _SELECTION_TYPES.get(value.lower(), value)
         return None
 
     def __str__(self):
         return self.value
 
 
+_SELECTION_TYPES = {
+    name.lower(): member for name, member in SelectionType.__members__.items()
+}
+
+
 class DialogAction(Enum):
     """Enum that defines how to handle a dialog."""
 
@@ -764,7 +781,7 @@ class CookieType(Enum):
 
 
 CookieSameSite = Enum(
-    "CookieSameSite", {"Strict": "Strict", "Lax": "Lax", "None": "None"}
+    "CookieSameSite", {"Strict": "Strict", "Lax": "Lax", "None": "None"}, type=str
 )
 CookieSameSite.__doc__ = """Enum that defines the Cookie SameSite type.
 
@@ -882,7 +899,16 @@ class SupportedBrowsers(Enum):
     webkit = auto()
 
 
-ColorScheme = Enum("ColorScheme", ["dark", "light", "no-preference", "null"])
+ColorScheme = Enum(
+    "ColorScheme",
+    {
+        "dark": "dark",
+        "light": "light",
+        "no-preference": "no-preference",
+        "null": "null",
+    },
+    type=str,
+)
 ColorScheme.__doc__ = """Emulates 'prefers-colors-scheme' media feature.
         Supported values are 'light', 'dark', 'no-preference' and `null`.
         Passing `null` disables color scheme emulation.
@@ -926,7 +952,7 @@ for more details.
 """
 
 
-ScrollBehavior = Enum("ScrollBehavior", ["auto", "smooth"])
+ScrollBehavior = Enum("ScrollBehavior", {"auto": "auto", "smooth": "smooth"}, type=str)
 ScrollBehavior.__doc__ = """Enum that controls the behavior of scrolling.
 
 ``smooth``
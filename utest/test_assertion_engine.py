@@ -0,0 +1,53 @@
+from typing import Optional
+
+from assertionengine import AssertionOperator
+
+from Browser.assertion_engine import (
+    _assertion_operator_position,
+    assertion_operator_is_set,
+)
+
+
+class Keywords:
+    def get_text(
+        self,
+        selector: str,
+        assertion_operator: Optional[AssertionOperator] = None,
+        assertion_expected: Optional[str] = None,
+    ) -> str:
+        return ""
+
+    def click(self, selector: str) -> None:
+        pass
+
+
+def test_positional_assertion_operator():
+    kw = Keywords().get_text
+    assert (
+        assertion_operator_is_set(kw, ("h1", AssertionOperator.equal, "foo"), {})
+        is AssertionOperator.equal
+    )
+    assert assertion_operator_is_set(kw, ("h1",), {}) is None
+
+
+def test_keyword_argument_assertion_operator():
+    kw = Keywords().get_text
+    assert (
+        assertion_operator_is_set(
+            kw, ("h1",), {"assertion_operator": AssertionOperator.contains}
+        )
+        is AssertionOperator.contains
+    )
+
+
+def test_keyword_without_assertion_operator():
+    assert assertion_operator_is_set(Keywords().click, ("h1",), {}) is None
+
+
+def test_position_is_cached_for_bound_methods():
+    _assertion_operator_position.cache_clear()
+    for keywords in (Keywords(), Keywords()):
+        assertion_operator_is_set(keywords.get_text, ("h1",), {})
+    info = _assertion_operator_position.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
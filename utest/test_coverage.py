@@ -0,0 +1,85 @@
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from Browser.generated.playwright_pb2 import Request, Response
+from Browser.keywords import Coverage
+from Browser.playwright import Playwright
+from Browser.utils import CoverageType
+
+
+def test_find_coverage_report(tmp_path: Path):
+    find_report = Coverage._find_coverage_report
+    assert find_report(tmp_path / "missing") is None
+    (tmp_path / "coverage-data.json").write_text("{}")
+    assert find_report(tmp_path / "coverage-data.json") is None
+    (tmp_path / "assets.html").mkdir()
+    assert find_report(tmp_path) is None
+    (tmp_path / "index.html").write_text("<html></html>")
+    assert find_report(tmp_path) == tmp_path / "index.html"
+
+
+def test_find_coverage_report_unreadable_folder(tmp_path: Path):
+    with patch.object(Path, "iterdir", side_effect=PermissionError):
+        assert Coverage._find_coverage_report(tmp_path) is None
+
+
+@pytest.fixture
+def library():
+    library = MagicMock()
+    library.coverage_output = Path("/out/browser/coverage")
+    library.playwright.serialized_request_call.return_value.return_value.log = ""
+    return library
+
+
+def test_start_coverage_sends_serialized_request(library: MagicMock):
+    call = library.playwright.serialized_request_call.return_value
+    coverage = Coverage(library)
+    for _ in range(2):
+        coverage.start_coverage(coverage_type=CoverageType.js, raw=True)
+    library.playwright.serialized_request_call.assert_called_once()
+    assert call.call_count == 2
+    request = Request.CoverageStart.FromString(call.call_args[0][0])
+    assert request.coverageType == "js"
+    assert request.raw
+    assert request.resetOnNavigation
+    assert not request.reportAnonymousScripts
+    assert request.configFile == ""
+    assert request.coverageDir == str(Path("/out/browser/coverage"))
+
+
+def test_start_coverage_with_different_arguments(library: MagicMock):
+    call = library.playwright.serialized_request_call.return_value
+    coverage = Coverage(library)
+    coverage.start_coverage(coverage_type=CoverageType.css, config_file=Path("a.js"))
+    coverage.start_coverage(coverage_type=CoverageType.css, path=Path("page"))
+    first, second = (
+        Request.CoverageStart.FromString(args[0][0]) for args in call.call_args_list
+    )
+    assert first.configFile == "a.js"
+    assert second.configFile == ""
+    assert second.coverageDir == str(Path("/out/browser/coverage/page"))
+    assert first.coverageType == second.coverageType == "css"
+
+
+def test_start_coverage_returns_coverage_type(library: MagicMock):
+    coverage = Coverage(library)
+    assert coverage.start_coverage() == "CoverageType.all"
+    assert coverage.start_coverage(coverage_type=CoverageType.js) == "CoverageType.js"
+
+
+def test_serialized_request_call_uses_service_method_path():
+    playwright = MagicMock()
+    Playwright.serialized_request_call(
+        playwright, "StartCoverage", Response.Empty.FromString
+    )
+    playwright._channel.unary_unary.assert_called_once_with(
+        "/Playwright/StartCoverage",
+        request_serializer=None,
+        response_deserializer=Response.Empty.FromString,
+    )
+    with pytest.raises(KeyError):
+        Playwright.serialized_request_call(
+            playwright, "StartCoverag", Response.Empty.FromString
+        )
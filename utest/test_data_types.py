@@ -0,0 +1,61 @@
+from typing import Optional
+
+import pytest
+
+from Browser.utils.data_types import (
+    ColorScheme,
+    CookieSameSite,
+    GeoLocation,
+    Proxy,
+    ScrollBehavior,
+    SelectionType,
+    ViewportDimensions,
+    convert_typed_dict,
+)
+
+
+def test_selection_type_create():
+    assert SelectionType.create("current") is SelectionType.CURRENT
+    assert SelectionType.create("Active") is SelectionType.CURRENT
+    assert SelectionType.create("ANY") is SelectionType.ALL
+    assert SelectionType.create(SelectionType.ALL) is SelectionType.ALL
+    assert SelectionType.create("browser=1234") == "browser=1234"
+    assert SelectionType.create(None) is None
+
+
+def test_convert_typed_dict_keys_are_case_insensitive():
+    def kw(geolocation: GeoLocation, proxy: Optional[Proxy] = None):
+        pass
+
+    params = convert_typed_dict(
+        kw.__annotations__,
+        {"geolocation": {"LATITUDE": "1.5", "Longitude": 2}, "proxy": None},
+    )
+    assert params["geolocation"] == {"latitude": 1.5, "longitude": 2.0}
+    assert params["proxy"] is None
+
+
+def test_convert_typed_dict_missing_required_key():
+    def kw(geolocation: GeoLocation):
+        pass
+
+    with pytest.raises(RuntimeError, match="required key 'longitude'"):
+        convert_typed_dict(kw.__annotations__, {"geolocation": {"latitude": 1}})
+
+
+def test_string_valued_enums():
+    assert ColorScheme["no-preference"] == "no-preference"
+    assert ScrollBehavior.smooth == "smooth"
+    assert CookieSameSite("Lax") is CookieSameSite.Lax
+    assert ColorScheme("null") is ColorScheme.null
+
+
+def test_convert_typed_dict_converts_only_wrong_types():
+    def kw(viewport: ViewportDimensions):
+        pass
+
+    params = convert_typed_dict(
+        kw.__annotations__, {"viewport": {"width": True, "height": "20"}}
+    )
+    assert params["viewport"] == {"width": 1, "height": 20}
+    assert type(params["viewport"]["width"]) is int